@@ -13,6 +13,7 @@ Features:
 
 Dependencies:
 - pandas
+- numpy (installed with pandas)
 - matplotlib
 - seaborn
 - turtle (built-in)
@@ -24,15 +25,89 @@ Code Last Updated: 2024-12-02
 """
 
 # The following libraries are imported to support data cleaning, statistical analysis, and interactive visualizations:
+# (matplotlib, seaborn and turtle are imported inside the functions that draw, so the rest of the tool starts without them)
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-import turtle
+import numpy as np
 import hashlib # The hashlib module provides secure hash functions such as SHA-256
+import functools # Provides lru_cache to remember results of repeated function calls
 import sqlite3 # SQLite3 allows for interaction with SQLite databases directly from Python
 import os
+import re # Regular expressions, for finding answers in the exported survey data
+import traceback # Prints the details of unexpected errors
+from pathlib import Path # Path objects, for checking and opening the statistics files
 from datetime import datetime, timedelta # The datetime module provides classes for working with dates and times
 
+# Set to True to print details of the statistics files as they are parsed
+DEBUG = False
+
+
+# Numeric scales for the survey answers, in the order they appear in the survey
+_HEALTH_MAP = {
+    "Poor": 1,
+    "Fair": 2,
+    "Good": 3,
+    "Very good": 4,
+    "Excellent": 5
+}
+
+_FREQ_MAP = {
+    "Not in the past three months": 0,
+    "Less than monthly": 1,
+    "Monthly": 2,
+    "A few times a month": 3,
+    "Weekly": 4,
+    "A few times a week": 5,
+    "Daily or almost daily": 6
+}
+
+# Weekly hours spent alone are divided into ranges; each range includes its upper bound
+_TIME_ALONE_UPPER_BOUNDS = np.array([20, 40, 80, 120, 168], dtype=np.float32)
+
+# Labels of the ranges, as an ordered type so charts show them from fewest to most hours without re-sorting
+_TIME_ALONE_DTYPE = pd.CategoricalDtype(
+    categories=["0-20", "21-40", "41-80", "81-120", "121-168"],
+    ordered=True
+)
+
+
+def bin_time_alone(hours):
+    """
+    Find the range (0-20, 21-40, 41-80, 81-120, 121-168) of each number of weekly hours spent alone.
+
+    Args:
+        hours (np.ndarray): Weekly hours spent alone
+
+    Returns:
+        np.ndarray: The range number 0-4 of each value (int8), or -1 for hours outside 0-168 or missing
+
+    """
+    # Searching on the left of the upper bounds gives the range number directly (e.g. 20 -> 0, 20.5 -> 1)
+    codes = np.searchsorted(_TIME_ALONE_UPPER_BOUNDS, hours, side="left").astype(np.int8)
+    return np.where((hours >= 0) & (hours <= 168), codes, -1).astype(np.int8)
+
+
+def encode_responses(series, mapping):
+    """
+    Convert text survey answers to their numeric scale values.
+
+    Args:
+        series (pd.Series): Raw text answers (may contain leading/trailing spaces)
+        mapping (dict): Answer text -> numeric value, e.g. _HEALTH_MAP
+
+    Returns:
+        np.ndarray: Numeric values, with NaN for answers not found in the mapping (e.g. '9999')
+
+    """
+    # Each row gets a small integer code for its answer (-1 if missing), and the handful of distinct answers
+    # are listed once in `uniques`. Only those few answers need to be stripped and looked up in the mapping.
+    codes, uniques = pd.factorize(series)
+
+    # One numeric value per distinct answer, plus NaN at the end so missing answers (code -1) become NaN
+    values = np.array([mapping.get(str(answer).strip(), np.nan) for answer in uniques] + [np.nan])
+
+    # Look up the numeric value of every row at once
+    return np.take(values, codes)
+
 
 # Module 1: Preprocess and Categorize Data
 # This module is responsible for preprocessing and categorizing data, particularly for handling survey responses related to social time, physical health, mental health, face-to-face interactions, and volunteering.
@@ -43,6 +118,7 @@ def preprocess_categorical_data(df):
     Args:
         df (pd.DataFrame): Raw input DataFrame containing survey responses
             Required columns:
+            - LONELY_dejong_emotional_social_loneliness_scale_TOTAL
             - CONNECTION_social_time_alone
             - WELLNESS_self_rated_physical_health
             - WELLNESS_self_rated_mental_health
@@ -50,7 +126,8 @@ def preprocess_categorical_data(df):
             - CONNECTION_activities_volunteered_p3m
     
     Returns:
-        pd.DataFrame: Preprocessed DataFrame with mapped categorical values
+        pd.DataFrame: Preprocessed DataFrame with mapped categorical values, plus
+            CONNECTION_social_time_alone_bin: the time spent alone range as a number 0-4
 
     Raises:
         KeyError: If required columns are missing
@@ -60,82 +137,41 @@ def preprocess_categorical_data(df):
 
     # Ensure 'CONNECTION_social_time_alone' is numeric
     # Ensures that non-numeric values are converted to NaN, which are then removed    
-    df.loc[:, "CONNECTION_social_time_alone"] = pd.to_numeric(
-        df["CONNECTION_social_time_alone"], errors="coerce"
-    )
-    df = df.dropna(subset=["CONNECTION_social_time_alone"])
-
+    hours_alone = pd.to_numeric(df["CONNECTION_social_time_alone"], errors="coerce")
+    df = df[hours_alone.notna()].copy()  # Work on a copy so the caller's DataFrame is not modified
+    df["CONNECTION_social_time_alone"] = hours_alone
 
     # Categorize 'CONNECTION_social_time_alone' into defined hourly ranges 
-    # These ranges represent weekly hours spent alone, aiding in grouping data.    
-    df.loc[:, "CONNECTION_social_time_alone"] = pd.cut(
-        df["CONNECTION_social_time_alone"],
-        # Map social time categories to numeric values for analysis        
-        bins=[0, 20, 40, 80, 120, 168],   # Weekly hours are divided into ranges
-        labels=["0-20", "21-40", "41-80", "81-120", "121-168"],
-        include_lowest=True
-    )
-    
-    
+    # These ranges represent weekly hours spent alone, aiding in grouping data.
+    # The range numbers 0-4 are kept for calculating benchmarks, and the labelled ranges for charts
+    codes = bin_time_alone(df["CONNECTION_social_time_alone"].to_numpy(dtype=np.float32))
+    df["CONNECTION_social_time_alone_bin"] = codes
+    df["CONNECTION_social_time_alone"] = pd.Categorical.from_codes(codes, dtype=_TIME_ALONE_DTYPE)  # -1 becomes NaN
+
+    # Ensure the loneliness score is numeric (float32 is plenty for a 0-6 score), so correlations and averages
+    # work on numbers directly
+    df["LONELY_dejong_emotional_social_loneliness_scale_TOTAL"] = pd.to_numeric(
+        df["LONELY_dejong_emotional_social_loneliness_scale_TOTAL"], errors="coerce"
+    ).astype("float32")
+
     # Map self-rated physical health responses to numeric values --> To facilitate statistical comparisons
-    df.loc[:, "WELLNESS_self_rated_physical_health"] = (
-        df["WELLNESS_self_rated_physical_health"]
-        .astype(str)  # Convert to string for consistent processing
-        .str.strip()  # Remove leading/trailing spaces
-        .replace({
-            "Poor": 1,
-            "Fair": 2,
-            "Good": 3,
-            "Very good": 4,
-            "Excellent": 5
-        })
+    df["WELLNESS_self_rated_physical_health"] = encode_responses(
+        df["WELLNESS_self_rated_physical_health"], _HEALTH_MAP
     )
 
-
     # Map self-rated mental health responses to numeric values
-    df.loc[:, "WELLNESS_self_rated_mental_health"] = (
-        df["WELLNESS_self_rated_mental_health"]
-        .astype(str)  # Convert to string for consistent processing
-        .str.strip()  # Remove leading/trailing spaces
-        .replace({
-            "Poor": 1,
-            "Fair": 2,
-            "Good": 3,
-            "Very good": 4,
-            "Excellent": 5
-        })
+    df["WELLNESS_self_rated_mental_health"] = encode_responses(
+        df["WELLNESS_self_rated_mental_health"], _HEALTH_MAP
     )
-  
+
     # Map face-to-face conversation frequency responses to numeric values
-    df.loc[:, "CONNECTION_activities_face_to_face_convorsation_p3m"] = (
-        df["CONNECTION_activities_face_to_face_convorsation_p3m"]
-        .astype(str)  # Convert to string for consistent processing
-        .str.strip()  # Remove leading/trailing spaces
-        .replace({
-            "Not in the past three months": 0,
-            "Less than monthly": 1,
-            "Monthly": 2,
-            "A few times a month": 3,
-            "Weekly": 4,
-            "A few times a week": 5,
-            "Daily or almost daily": 6
-        })
+    df["CONNECTION_activities_face_to_face_convorsation_p3m"] = encode_responses(
+        df["CONNECTION_activities_face_to_face_convorsation_p3m"], _FREQ_MAP
     )
-    
+
     # Map volunteering frequency responses to numerical values
-    df.loc[:, "CONNECTION_activities_volunteered_p3m"] = (
-        df["CONNECTION_activities_volunteered_p3m"]      
-        .astype(str)
-        .str.strip()    
-        .replace({
-            "Not in the past three months": 0,
-            "Less than monthly": 1,
-            "Monthly": 2,
-            "A few times a month": 3,
-            "Weekly": 4,
-            "A few times a week": 5,            
-            "Daily or almost daily": 6
-        })
+    df["CONNECTION_activities_volunteered_p3m"] = encode_responses(
+        df["CONNECTION_activities_volunteered_p3m"], _FREQ_MAP
     )
 
     return df
@@ -147,23 +183,22 @@ def preprocess_categorical_data(df):
 # - Load raw data from a CSV file.
 # - Filter and retain specific columns for analysis
 # - Clean data by handling missing values
-def load_and_clean_data(file_path):
+def load_and_clean_data(file_path, chunksize=200_000):
     """
     Load and clean the dataset from a csv file (2024 Cross-Sectional Data.csv)
 
     Args:
         file_path (str): Path to the CSV dataset file
+        chunksize (int): Number of rows to read from the file at a time. Defaults to 200,000.
 
     Returns:
         pd.DataFrame: A cleaned DataFrame with:
                       - Retained relevant columns
                       - Filtered rows for participants aged 65 or above
                       - Processed categorical variables
+                      - The time spent alone range as a number 0-4 (CONNECTION_social_time_alone_bin)
 
     """
-    # Load the dataset into a DataFrame
-    df = pd.read_csv(file_path)
-    
     # To retain only the required columns for analysis
     columns_needed = [
         'PARTICIPANT_ID',
@@ -175,21 +210,46 @@ def load_and_clean_data(file_path):
         'WELLNESS_self_rated_mental_health',
         'CONNECTION_activities_volunteered_p3m'
     ]
-    
-    # Keep only the specified columns
-    df = df[columns_needed].astype(str)  # Convert all columns to strings to handle mixed types
-    
-    # Preprocess and categorize relevant columes (aka variables)
-    df = preprocess_categorical_data(df)        
-    
-    # Convert 'DEMO_age' column to numeric for filtering by age
-    df['DEMO_age'] = pd.to_numeric(df['DEMO_age'], errors='coerce')
-    
-    # Filter for participants aged 65+
-    df = df[df['DEMO_age'] >= 65]    
-    
-    # Replace missing values ('9999') with NaN and drop rows with missing values
-    df = df.replace('9999', pd.NA).dropna() 
+
+    # Types to parse the text answer columns as
+    # The numeric columns are left for pandas to infer and are converted per chunk below, so a stray
+    # non-numeric cell only drops its row instead of stopping the whole load
+    column_types = {
+        'CONNECTION_activities_face_to_face_convorsation_p3m': 'string',
+        'WELLNESS_self_rated_physical_health': 'string',
+        'WELLNESS_self_rated_mental_health': 'string',
+        'CONNECTION_activities_volunteered_p3m': 'string'
+    }
+
+    # Load only the specified columns, reading the file in chunks of rows
+    # The survey uses '9999' for missing answers, so they are read in as NaN straight away
+    # Each chunk is filtered, preprocessed and cleaned before moving on to the next one,
+    # so only the final rows are ever collected and the whole file is never held in memory at once
+    parts = []
+    with pd.read_csv(
+        file_path,
+        usecols=columns_needed,
+        dtype=column_types,
+        na_values=["9999", "9999.0"],
+        engine="c",
+        chunksize=chunksize
+    ) as reader:
+        for chunk in reader:
+            # Ensure age is numeric (float32 is plenty); non-numeric ages become NaN and are filtered out below
+            # The loneliness score and hours alone are converted the same way during preprocessing
+            chunk['DEMO_age'] = pd.to_numeric(chunk['DEMO_age'], errors="coerce", downcast="float")
+
+            # Filter for participants aged 65+
+            chunk = chunk[chunk['DEMO_age'] >= 65]
+
+            # Preprocess and categorize relevant columes (aka variables)
+            chunk = preprocess_categorical_data(chunk)
+
+            # Drop rows with missing values ('9999' answers were already read in as NaN)
+            parts.append(chunk.dropna(subset=columns_needed))
+
+    # Combine the cleaned chunks; usecols keeps the file's column order, so restore ours
+    df = pd.concat(parts)[columns_needed + ["CONNECTION_social_time_alone_bin"]]
 
     return df
 
@@ -215,6 +275,57 @@ def generate_visualizations(df):
         df (pd.DataFrame): Preprocessed and cleaned dataset ready for visualization.
         
     """
+    # Plotting libraries are only loaded once a chart is actually needed
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    # Labels for the 0-6 frequency scale, in order: each numeric value is the position of its label
+    # Explicitly define the order of interaction frequencies to ensure consistency in visualization
+    frequency_labels = np.array([
+        "Not in the past three months",
+        "Less than monthly",
+        "Monthly",
+        "A few times a month",
+        "Weekly",
+        "A few times a week",
+        "Daily or almost daily"
+    ])
+
+    # The data does not change while the menu is open, so the numbers behind the heatmap and bar charts
+    # are calculated once here and reused every time a chart is selected
+    corr_columns = [
+        "LONELY_dejong_emotional_social_loneliness_scale_TOTAL",
+        "WELLNESS_self_rated_physical_health",
+        "WELLNESS_self_rated_mental_health"
+    ]
+    # All three columns are numeric, so the correlations are calculated on a plain float32 array
+    corr_mat = pd.DataFrame(
+        np.corrcoef(df[corr_columns].to_numpy(dtype=np.float32), rowvar=False),
+        index=corr_columns,
+        columns=corr_columns
+    )
+
+    # Mean loneliness score for each face-to-face conversation frequency
+    # Map numeric scale back to labels for better visualization, keeping every label on the x-axis in order
+    ff_means = (
+        df.groupby("CONNECTION_activities_face_to_face_convorsation_p3m")
+        ["LONELY_dejong_emotional_social_loneliness_scale_TOTAL"]
+        .mean()
+    )
+    ff_means.index = np.take(frequency_labels, ff_means.index.astype(int))
+    ff_means = ff_means.reindex(frequency_labels)
+
+    # Mean and standard deviation of the loneliness score for each volunteering frequency
+    vol_agg = (
+        df.groupby("CONNECTION_activities_volunteered_p3m")
+        ["LONELY_dejong_emotional_social_loneliness_scale_TOTAL"]
+        .agg(["mean", "std"])
+    )
+    vol_agg.index = np.take(frequency_labels, vol_agg.index.astype(int))  # Replace numeric indices with labels
+
+    # Highest loneliness score, used to size the y-axis of the face-to-face chart
+    max_loneliness = df["LONELY_dejong_emotional_social_loneliness_scale_TOTAL"].max()
+
     while True:
         print("\nVisualization Menu Part 1:")
         print("1. Box & Whisker Plot: Loneliness vs. Time Spent Alone (Categorized)")
@@ -228,17 +339,12 @@ def generate_visualizations(df):
         if choice == '1':
             # Box Plot: Loneliness vs. Time Spent Alone            
             plt.figure(figsize=(8, 6)) # Set the figure size for the visualization
-            # Ensure the categories are ordered explicitly
-            df["CONNECTION_social_time_alone"] = pd.Categorical(
-                df["CONNECTION_social_time_alone"],  
-                categories=["0-20", "21-40", "41-80", "81-120", "121-168"],
-                ordered=True
-            )            
+            # The time spent alone ranges are already an ordered categorical type (see preprocess_categorical_data),
+            # and Seaborn draws the boxes in that order
             sns.boxplot(
                 x="CONNECTION_social_time_alone",
                 y="LONELY_dejong_emotional_social_loneliness_scale_TOTAL",
-                data=df,
-                order=["0-20", "21-40", "41-80", "81-120", "121-168"]  # Explicitly set order here as well because: Even if the pd.Categorical ensures the correct order in the data, sns.boxplot does not rely on the underlying categorical order. By default, Seaborn ordered categories alphabetically or in our case randomly based on the order they appear in the data.
+                data=df
             )
             plt.title("Loneliness Score vs. Time Spent Alone")
             plt.xlabel("Time Spent Alone (Hours)")
@@ -248,68 +354,18 @@ def generate_visualizations(df):
         elif choice == '2':
             # Heatmap: Loneliness vs. Physical and Mental Health
             plt.figure(figsize=(8, 6))
-            sns.heatmap(
-                df[[
-                    "LONELY_dejong_emotional_social_loneliness_scale_TOTAL",
-                    "WELLNESS_self_rated_physical_health",
-                    "WELLNESS_self_rated_mental_health"
-                ]].corr(),
-                annot=True, cmap="coolwarm", square=True
-            )
+            sns.heatmap(corr_mat, annot=True, cmap="coolwarm", square=True)
             plt.title("Correlation: Loneliness, Physical and Mental Health")
             plt.show()
         elif choice == '3':
             # Bar Chart: Loneliness vs. Face-to-Face Conversations   
             plt.figure(figsize=(8, 6))
             
-            # Define the order of the categories for the x-axis
-            # Explicitly define the order of interaction frequencies to ensure consistency in visualization            
-            category_order = [
-                "Not in the past three months",
-                "Less than monthly",
-                "Monthly",
-                "A few times a month",
-                "Weekly",
-                "A few times a week",
-                "Daily or almost daily"
-            ]                        
-            
-            # Map numeric scale back to labels for better visualization
-            # Translate numeric values (0-6) into descriptive labels for clarity in the chart            
-            label_mapping = {
-                0: "Not in the past three months",
-                1: "Less than monthly",
-                2: "Monthly",
-                3: "A few times a month",
-                4: "Weekly",
-                5: "A few times a week",
-                6: "Daily or almost daily"     
-            }
-            
-            # Replace numeric values with corresponding labels
-            df["CONNECTION_activities_face_to_face_convorsation_p3m"] = (
-                df["CONNECTION_activities_face_to_face_convorsation_p3m"]
-                .replace(label_mapping))
-            
-            # Ensure the 'Loneliness Score' column is numeric
-            df["LONELY_dejong_emotional_social_loneliness_scale_TOTAL"] = pd.to_numeric(
-                df["LONELY_dejong_emotional_social_loneliness_scale_TOTAL"], errors='coerce')
-        
-            # Create the cleaned DataFrame
-            # Remove rows with missing values to ensure accurate plotting            
-            df_cleaned = df.dropna(subset=[
-                "CONNECTION_activities_face_to_face_convorsation_p3m",
-                "LONELY_dejong_emotional_social_loneliness_scale_TOTAL"
-            ])
-            
-            # Create the bar chart with the specified order
-            sns.barplot(
-                x="CONNECTION_activities_face_to_face_convorsation_p3m",
-                y="LONELY_dejong_emotional_social_loneliness_scale_TOTAL",
-                data=df_cleaned,
-                ci=None, # Disable confidence intervals for simplicity
-                palette="Blues_d",
-                order=category_order  # Ensure correct order of the x-axis categories
+            # Create the bar chart of the average loneliness score for each frequency, in order
+            ff_means.plot(
+                kind='bar',
+                width=0.8,
+                color=sns.color_palette("Blues_d", len(frequency_labels), desat=0.75)  # Same colours sns.barplot uses
             )
                               
             # Set the title and labels  
@@ -320,7 +376,7 @@ def generate_visualizations(df):
             
             # Set y-axis limits based on the range of your data
             # Generated by ChatGPT: Dynamically adjust the upper limit of the y-axis by adding 1 to the maximum score. Without the buffer, the highest bar in the plot was touching & overlap with the top edge of the plot.        
-            plt.ylim(0, df_cleaned["LONELY_dejong_emotional_social_loneliness_scale_TOTAL"].max() + 1)
+            plt.ylim(0, max_loneliness + 1)
             
             # Generated by ChatGPT: Rotate x-axis labels for better readability --> This is to ensure long labels do not overlap by rotating them
             plt.xticks(rotation=45, ha="right")  
@@ -334,25 +390,8 @@ def generate_visualizations(df):
             # Bar Plot: Loneliness vs. Volunteering Frequency
             plt.figure(figsize=(8, 6))
             
-            # Group the data by volunteering frequency and calculate mean and standard deviation            
-            grouped = df.groupby("CONNECTION_activities_volunteered_p3m")["LONELY_dejong_emotional_social_loneliness_scale_TOTAL"]
-            means = grouped.mean()
-            stds = grouped.std()
-
-            # Map numeric scale back to labels for better visualization
-            label_mapping = {
-                0: "Not in the past three months",
-                1: "Less than monthly",
-                2: "Monthly",
-                3: "A few times a month",
-                4: "Weekly",
-                5: "A few times a week",
-                6: "Daily or almost daily"
-            }
-            means.index = means.index.map(label_mapping)  # Replace numeric indices with labels
-
             # Plot the bar chart with error bars
-            means.plot(kind='bar', yerr=stds, capsize=5, color='skyblue', edgecolor='black', alpha=0.7)
+            vol_agg["mean"].plot(kind='bar', yerr=vol_agg["std"], capsize=5, color='skyblue', edgecolor='black', alpha=0.7)
             
             # Set the title and labels to provide meaningful context to the chart
             plt.title("Average Loneliness Score by Volunteering Frequency")
@@ -387,41 +426,27 @@ def calculate_benchmarks(df):
     Returns:
         dict: Benchmarks for relevant variables.
     """
-    # Map "CONNECTION_social_time_alone" into categorical values 0-4
-    bins = [0, 20, 40, 80, 120, 168]  # Weekly hour ranges for categorization
-    labels = [0, 1, 2, 3, 4]  # Numeric labels representing each range
-    df["CONNECTION_social_time_alone"] = pd.cut(
-        df["CONNECTION_social_time_alone"], 
-        bins=bins, 
-        labels=labels, 
-        include_lowest=True) # Ensure that the lowest value (0) is included in the first bin
-    
-    # Convert the column to numeric for calculation purposes
-    # This step is necessary because the categorization converts the column to a categorical data type    
-    df["CONNECTION_social_time_alone"] = df["CONNECTION_social_time_alone"].astype(float)
+    # Variables of interest for the benchmarks, and the columns they are calculated from
+    # "CONNECTION_social_time_alone" uses its range number 0-4, calculated during preprocessing
+    columns = {
+        "CONNECTION_social_time_alone": "CONNECTION_social_time_alone_bin",
+        "WELLNESS_self_rated_physical_health": "WELLNESS_self_rated_physical_health",
+        "WELLNESS_self_rated_mental_health": "WELLNESS_self_rated_mental_health",
+        "CONNECTION_activities_face_to_face_convorsation_p3m": "CONNECTION_activities_face_to_face_convorsation_p3m",
+        "CONNECTION_activities_volunteered_p3m": "CONNECTION_activities_volunteered_p3m"
+    }
+
+    # Calculate the mean and median of every variable in a single call
+    # The values are small scale numbers, so float32 is precise enough and halves the data to read
+    stats = df[list(columns.values())].astype("float32").agg(["mean", "median"])
 
     # Initialize a dictionary to store mean and median benchmarks for key variables
     benchmarks = {
-        "CONNECTION_social_time_alone": {
-            "mean": df["CONNECTION_social_time_alone"].mean(),
-            "median": df["CONNECTION_social_time_alone"].median(),
-        },
-        "WELLNESS_self_rated_physical_health": {
-            "mean": df["WELLNESS_self_rated_physical_health"].mean(),
-            "median": df["WELLNESS_self_rated_physical_health"].median(),
-        },
-        "WELLNESS_self_rated_mental_health": {
-            "mean": df["WELLNESS_self_rated_mental_health"].mean(),
-            "median": df["WELLNESS_self_rated_mental_health"].median(),
-        },
-        "CONNECTION_activities_face_to_face_convorsation_p3m": {
-            "mean": df["CONNECTION_activities_face_to_face_convorsation_p3m"].mean(),
-            "median": df["CONNECTION_activities_face_to_face_convorsation_p3m"].median(),  
-        },
-        "CONNECTION_activities_volunteered_p3m": {
-            "mean": df["CONNECTION_activities_volunteered_p3m"].mean(),
-            "median": df["CONNECTION_activities_volunteered_p3m"].median(),
-        },
+        variable: {
+            "mean": float(stats.at["mean", column]),
+            "median": float(stats.at["median", column]),
+        }
+        for variable, column in columns.items()
     }
     
     # Return the dictionary containing calculated benchmarks    
@@ -464,7 +489,7 @@ if __name__ == "__main__":
         "CONNECTION_activities_face_to_face_convorsation_p3m": [1, 2, 3, 4],
         "WELLNESS_self_rated_physical_health": [3, 4, 5, 3],
         "WELLNESS_self_rated_mental_health": [4, 5, 3, 4],
-        "CONNECTION_social_time_alone": [10, 35, 90, 150],  # Example data
+        "CONNECTION_social_time_alone_bin": [0, 1, 3, 4],  # Example data: ranges of 10, 35, 90 and 150 hours
         "CONNECTION_activities_volunteered_p3m": [0, 1, 2, 3],
     })
 
@@ -478,10 +503,94 @@ if __name__ == "__main__":
 # Module 5: Turtle-Based Data Entry
 # This module allows users to input survey data through a graphical interface using the Turtle library
 # It includes functionalities such as resetting data, anonymizing user details, checking question intervals, and saving responses to a database.
+
+# Survey questions with their time intervals (in days) and answer scales
+# The database stores each question by its position in this dict (its question ID), so new questions go at the end
+QUESTIONS_WITH_SCALES = {
+    "Weekly: How many hours did you spend alone last week?": {
+        "interval": 7,
+        "options": [
+            "0-20 hours",
+            "21-40 hours",
+            "41-80 hours",
+            "81-120 hours",
+            "121-168 hours"
+        ]
+    },
+    "Weekly: How would you rate your physical health?": {
+        "interval": 7,
+        "options": [
+            "Poor",
+            "Fair",
+            "Good",
+            "Very good",
+            "Excellent"
+        ]
+    },
+    "Weekly: How would you rate your mental health?": {
+        "interval": 7,
+        "options": [
+            "Poor",
+            "Fair",
+            "Good",
+            "Very good",
+            "Excellent"
+        ]
+    },
+    "Quarterly: How often have you had face-to-face conversations in the past three months?": {
+        "interval": 91,
+        "options": [
+            "Not in the past three months",
+            "Less than monthly",
+            "Monthly",
+            "A few times a month",
+            "Weekly",
+            "A few times a week",
+            "Daily or almost daily"
+        ]
+    },
+    "Quarterly: How often have you volunteered in the past three months?": {
+        "interval": 91,
+        "options": [
+            "Not in the past three months",
+            "Less than monthly",
+            "Monthly",
+            "A few times a month",
+            "Weekly",
+            "A few times a week",
+            "Daily or almost daily"
+        ]
+    }
+}
+
+# Question texts, indexed by question ID
+QUESTIONS = tuple(QUESTIONS_WITH_SCALES)
+
+
+# Function to anonymize user names
+# Results are cached, so the same name is only hashed once
+@functools.lru_cache(maxsize=256)
+def anonymize_name(name):
+    """
+    Anonymize user name using SHA-256 hashing
+    
+    Args: name (str): User's name to anonymize
+    
+    Returns:str: SHA-256 hash of the input name
+    
+    Example: anonymize_name("Nayeon")
+    '7ab...'
+   
+    """
+    return hashlib.sha256(name.encode()).hexdigest()
+
+
 def turtle_based_data_entry():
     """
     Collect user survey data using a Turtle-based graphical interface with proper time intervals for questions.
     """  
+    # Turtle (and the Tk window system behind it) is only loaded when the survey is actually used
+    import turtle
     
     # Function to reset survey data    
     def reset_survey_data():
@@ -505,27 +614,23 @@ def turtle_based_data_entry():
             except Exception as e:
                 print(f"Error deleting survey_data.db: {e}")
 
-    # Function to anonymize user names
-    def anonymize_name(name):
-        """
-        Anonymize user name using SHA-256 hashing
-        
-        Args: name (str): User's name to anonymize
-        
-        Returns:str: SHA-256 hash of the input name
-        
-        Example: anonymize_name("Nayeon")
-        '7ab...'
-       
-        """
-        return hashlib.sha256(name.encode()).hexdigest()
-    
+        # Write-ahead log files SQLite may have left next to the database
+        for leftover in ("survey_data.db-wal", "survey_data.db-shm"):
+            if os.path.exists(leftover):
+                try:
+                    os.remove(leftover)
+                except Exception as e:
+                    print(f"Error deleting {leftover}: {e}")
+
     # Function to set up the survey database    
     def setup_database():
         """
         Connect to the SQLite database for storing survey responses and intervals
                 
         - Creates tables `survey_responses` and `question_intervals` if they do not exist
+        - Upgrades tables from earlier versions, which stored the full question text, to question IDs
+        - Uses write-ahead logging, so saving a survey does not wait on a full disk sync for every change
+        - Keeps temporary data in memory and enlarges the page cache
         - Returns:
             conn (sqlite3.Connection): Connection object for the database
             cursor (sqlite3.Cursor): Cursor object for executing SQL queries
@@ -533,42 +638,99 @@ def turtle_based_data_entry():
         """
         conn = sqlite3.connect("survey_data.db")
         cursor = conn.cursor()
+        # Connection settings, applied once when the database is opened:
+        # - WAL and NORMAL sync avoid a full disk sync on every commit
+        # - Temporary tables and indexes are kept in memory, with a page cache of about 20 MB
+        cursor.executescript('''
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA temp_store=MEMORY;
+        PRAGMA cache_size=-20000;
+        ''')
+
+        # Tables from earlier versions have a `question` text column; move them aside so their rows
+        # can be copied into the new tables below
+        cursor.execute("PRAGMA table_info(survey_responses)")
+        has_old_tables = "question" in [column[1] for column in cursor.fetchall()]
+        if has_old_tables:
+            cursor.execute("ALTER TABLE survey_responses RENAME TO old_survey_responses")
+            cursor.execute("ALTER TABLE question_intervals RENAME TO old_question_intervals")
+
         cursor.execute('''
         CREATE TABLE IF NOT EXISTS survey_responses (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             user_id TEXT,
             survey_date TEXT,
-            question TEXT,
+            question_id INTEGER,
             response INTEGER
         )
         ''')
         cursor.execute('''
         CREATE TABLE IF NOT EXISTS question_intervals (
             user_id TEXT,
-            question TEXT,
+            question_id INTEGER,
             last_answered_date TEXT,
             interval_days INTEGER,
-            PRIMARY KEY (user_id, question)
+            PRIMARY KEY (user_id, question_id)
         )
         ''')
+
+        if has_old_tables:
+            copy_old_tables(cursor)
         conn.commit()
         return conn, cursor
+
+    # Function to upgrade survey data saved by earlier versions
+    def copy_old_tables(cursor):
+        """
+        Copy rows from the old tables (keyed by question text) into the current tables (keyed by question ID),
+        then drop the old tables. Rows for questions that are no longer asked are left out.
+        """
+        question_ids = {question: question_id for question_id, question in enumerate(QUESTIONS)}
+
+        cursor.execute("SELECT id, user_id, survey_date, question, response FROM old_survey_responses")
+        cursor.executemany(
+            "INSERT INTO survey_responses (id, user_id, survey_date, question_id, response) VALUES (?, ?, ?, ?, ?)",
+            [(row_id, user_id, survey_date, question_ids[question], response)
+             for row_id, user_id, survey_date, question, response in cursor.fetchall()
+             if question in question_ids])
+
+        cursor.execute("SELECT user_id, question, last_answered_date, interval_days FROM old_question_intervals")
+        cursor.executemany(
+            "INSERT INTO question_intervals (user_id, question_id, last_answered_date, interval_days) VALUES (?, ?, ?, ?)",
+            [(user_id, question_ids[question], last_answered_date, interval_days)
+             for user_id, question, last_answered_date, interval_days in cursor.fetchall()
+             if question in question_ids])
+
+        cursor.execute("DROP TABLE old_survey_responses")
+        cursor.execute("DROP TABLE old_question_intervals")
     
+    # Function to look up when the user last answered each question
+    def get_last_answered_dates(cursor, user_id):
+        """
+        Load the last answered date of every question the user has answered, in a single query.
+
+        Returns: dict: question ID -> last answered date (YYYY-MM-DD)
+        """
+        cursor.execute(
+            '''
+            SELECT question_id, last_answered_date FROM question_intervals WHERE user_id = ?
+            ''', (user_id,))
+        return dict(cursor.fetchall())
+
     # Function to check if a question is due for the user    
-    def is_question_due(cursor, user_id, question, interval_days, survey_date):
+    def is_question_due(last_answered_dates, question_id, interval_days, survey_date):
         """
         Check if a question is due based on the entered survey date
         - Ensures questions are only asked again after the specified interval.
         - Prints the number of days remaining if the question is not due.
+
+        Args: last_answered_dates (dict): The user's dates from get_last_answered_dates
         """
-        cursor.execute(
-            '''
-            SELECT last_answered_date FROM question_intervals WHERE user_id = ? AND question = ?
-            ''', (user_id, question))
-        result = cursor.fetchone()
+        last_answered_date = last_answered_dates.get(question_id)
         
-        if result:
-            last_date = datetime.strptime(result[0], "%Y-%m-%d")
+        if last_answered_date:
+            last_date = datetime.strptime(last_answered_date, "%Y-%m-%d")
             survey_date_obj = datetime.strptime(survey_date, "%Y-%m-%d")
             days_since_last = (survey_date_obj - last_date).days
             days_remaining = interval_days - days_since_last
@@ -578,34 +740,40 @@ def turtle_based_data_entry():
                 return False
         return True
     
-    # Function to update the last answered date for a question    
-    def update_question_date(cursor, conn, user_id, question, interval_days, survey_date):
+    # Function to update the last answered dates for the answered questions
+    def update_question_dates(cursor, interval_rows):
         """
-        Update the last answered date for a question in the `question_intervals` table.
+        Update the last answered dates in the `question_intervals` table.
+
+        Args: interval_rows (list): (user_id, question_id, last_answered_date, interval_days) tuples
+
+        The caller commits, so the updates can be saved together with the survey responses.
         """        
-        cursor.execute('''
-        INSERT OR REPLACE INTO question_intervals (user_id, question, last_answered_date, interval_days)
+        cursor.executemany('''
+        INSERT OR REPLACE INTO question_intervals (user_id, question_id, last_answered_date, interval_days)
         VALUES (?, ?, ?, ?)
-        ''', (user_id, question, survey_date, interval_days))
-        conn.commit()
+        ''', interval_rows)
     
     # Function to export all survey responses    
-    def export_all_responses():
-        """Export all responses to a text file"""
-        conn, cursor = setup_database()
+    def export_all_responses(cursor):
+        """Export all responses to a text file, using the survey's open database cursor"""
         cursor.execute('''SELECT * FROM survey_responses''')
         rows = cursor.fetchall()
         filename = "all_user_data.txt"
         with open(filename, "w") as file:
             for row in rows:
-                file.write(f"User ID: {row[1]}, Survey Date: {row[2]}, Question: {row[3]}, Response: {row[4]}\n")
+                file.write(f"User ID: {row[1]}, Survey Date: {row[2]}, Question: {QUESTIONS[row[3]]}, Response: {row[4]}\n")
         print(f"All responses exported to {filename}")
     
     # Main survey function    
-    def run_survey():
+    def run_survey(conn, cursor):
         """
         Conduct the survey using a Turtle-based interface.
 
+        Args:
+            conn (sqlite3.Connection): Open connection to the survey database
+            cursor (sqlite3.Cursor): Cursor of that connection
+
         - Presents questions to the user and collects responses.
         - Ensures questions respect their specified time intervals.
         - Saves responses to the database and exports them to a text file.
@@ -618,9 +786,9 @@ def turtle_based_data_entry():
         screen.setup(width=800, height=700)
         screen.title("Measuring Loneliness Survey")
         screen.bgcolor("white")
-        
-        # Connect to the database
-        conn, cursor = setup_database()
+        # Draw off-screen and show each finished page with a single `screen.update()`,
+        # instead of repainting the window after every line of text
+        screen.tracer(0)
     
         # Get the user's name and anonymize it
         user_name = screen.textinput("User Name", "Enter your name:")
@@ -647,69 +815,14 @@ def turtle_based_data_entry():
         pen.hideturtle()
         pen.speed(0)
         
-        # Questions and scales with intervals
-        questions_with_scales = {
-            "Weekly: How many hours did you spend alone last week?": {
-                "interval": 7,
-                "options": [
-                    "0-20 hours",
-                    "21-40 hours",
-                    "41-80 hours",
-                    "81-120 hours",
-                    "121-168 hours"
-                ]
-            },
-            "Weekly: How would you rate your physical health?": {
-                "interval": 7,
-                "options": [
-                    "Poor",
-                    "Fair",
-                    "Good",
-                    "Very good",
-                    "Excellent"
-                ]
-            },
-            "Weekly: How would you rate your mental health?": {
-                "interval": 7,
-                "options": [
-                    "Poor",
-                    "Fair",
-                    "Good",
-                    "Very good",
-                    "Excellent"
-                ]
-            },
-            "Quarterly: How often have you had face-to-face conversations in the past three months?": {
-                "interval": 91,
-                "options": [
-                    "Not in the past three months",
-                    "Less than monthly",
-                    "Monthly",
-                    "A few times a month",
-                    "Weekly",
-                    "A few times a week",
-                    "Daily or almost daily"
-                ]
-            },
-            "Quarterly: How often have you volunteered in the past three months?": {
-                "interval": 91,
-                "options": [
-                    "Not in the past three months",
-                    "Less than monthly",
-                    "Monthly",
-                    "A few times a month",
-                    "Weekly",
-                    "A few times a week",
-                    "Daily or almost daily"
-                ]
-            }
-        }
-        
-        # Process each question and collect responses        
+        # Process each question and collect responses
+        # The responses and new answered dates are only saved to the database once the survey is finished
         responses = {}
+        interval_rows = []
         any_questions_available = False
-        for question, config in questions_with_scales.items():
-            if not is_question_due(cursor, user_id, question, config["interval"], survey_date):
+        last_answered_dates = get_last_answered_dates(cursor, user_id)
+        for question_id, (question, config) in enumerate(QUESTIONS_WITH_SCALES.items()):
+            if not is_question_due(last_answered_dates, question_id, config["interval"], survey_date):
                 continue
                 
             any_questions_available = True
@@ -725,48 +838,58 @@ def turtle_based_data_entry():
                 pen.goto(0, 200 - i * 30)
                 # Write the option text on the screen using the specified font and alignment               
                 pen.write(f"{i}: {label}", align="center", font=("Arial", 12, "normal"))
+            # Show the question and all of its options in one repaint
+            screen.update()
     
             # Get user input
+            # The valid range of inputs (0 to the number of options - 1) is displayed in the prompt,
+            # which stays the same for every attempt at this question
+            n_options = len(config["options"])
+            prompt = f"Select a number (0-{n_options - 1}):"
             while True:
-                # Prompt the user to input their answer using a Turtle text box      
-                # The valid range of inputs (0 to the number of options - 1) is displayed in the prompt                
-                user_input = screen.textinput("Your Answer", f"Select a number (0-{len(config['options'])-1}):")
-                # Validate the user input:        
-                # - Ensure it is not empty
-                # - Check if it is a digit                
-                # - Confirm the input is within the valid range of option indices                
-                if user_input and user_input.isdigit() and 0 <= int(user_input) < len(config["options"]):
-                    # Save the user's response for the current question                    
-                    responses[question] = int(user_input)
-                    # Update the last answered date for the question in the database
+                # Prompt the user to input their answer using a Turtle text box
+                user_input = screen.textinput("Your Answer", prompt)
+                # Validate the user input:
+                # - Ensure it is a whole number (an empty or cancelled input is not)
+                # - Confirm the input is within the valid range of option indices
+                try:
+                    answer = int(user_input)
+                except (TypeError, ValueError):
+                    continue
+                if 0 <= answer < n_options:
+                    # Save the user's response for the current question
+                    responses[question_id] = answer
+                    # Record the new last answered date for the question
                     # This ensures the question will only be asked again after the specified interval                    
-                    update_question_date(cursor, conn, user_id, question, config["interval"], survey_date)
+                    interval_rows.append((user_id, question_id, survey_date, config["interval"]))
                     break  # Exit the loop once a valid response is provided
 
         # Check if no questions were available for the user based on intervals
         if not any_questions_available:
             pen.clear()
             pen.write("No questions are currently due. Please check back later.", align="center", font=("Arial", 16, "bold"))
+            screen.update()
             # Wait for a user click to close the Turtle window and terminate the survey            
             screen.exitonclick()
             return
 
-        # Save responses to database
-        for question, response in responses.items():
-            cursor.execute('''
-            INSERT INTO survey_responses (user_id, survey_date, question, response)
+        # Save responses and answered dates to the database in a single transaction
+        # The `with conn` block commits once at the end (or rolls back everything if saving fails)
+        with conn:
+            cursor.executemany('''
+            INSERT INTO survey_responses (user_id, survey_date, question_id, response)
             VALUES (?, ?, ?, ?)
-            ''', (user_id, survey_date, question, response))
-        # Commit the changes to ensure the data is stored in the database        
-        conn.commit()
+            ''', [(user_id, survey_date, question_id, response) for question_id, response in responses.items()])
+            update_question_dates(cursor, interval_rows)
     
         # Export all responses
-        export_all_responses()
+        export_all_responses(cursor)
     
         # Clear the screen and thank the user for completing the survey    
         pen.clear()
         pen.goto(0, 0)
         pen.write("Survey completed. Thank you!", align="center", font=("Arial", 16, "bold"))
+        screen.update()
         
         # Wait for a user click to close the Turtle window and terminate the program        
         screen.exitonclick()
@@ -778,18 +901,74 @@ def turtle_based_data_entry():
         reset_survey_data()
     
     # Run the survey with error handling
+    conn = None
     try:
+        # Connect to the database once; the survey and the export both use this connection
+        conn, cursor = setup_database()
         # Start the survey and handle any runtime errors        
-        run_survey()
+        run_survey(conn, cursor)
     except turtle.Terminator:
         # Handle the case where the Turtle window is closed prematurely by the user        
         print("Survey window was closed.")
     except Exception as e:
         # Print any unexpected errors that occur during the survey process        
         print(f"An error occurred: {str(e)}")
+    finally:
+        # Close the database connection once the survey is over
+        if conn is not None:
+            conn.close()
    
 
 # Module 6: Calculate and save user statistics
+
+# Categories of the survey questions, by a keyword found in the (lowercase) question text
+USER_STATISTICS_CATEGORIES = {
+    "how many hours did you spend alone": "Hours Alone",
+    "physical health": "Physical Health",
+    "mental health": "Mental Health",
+    "face-to-face conversations": "Face-to-Face Conversations",
+    "volunteered": "Volunteering"
+}
+
+# Pattern finding the question keyword and the response number on each line of exported survey data, in one match
+# Each line looks like "User ID: ..., Survey Date: ..., Question: <question>, Response: <number>",
+# so the search only starts looking for a keyword from "Question: "
+# All keywords may be in any case; the matched keyword is lowercased to find its category
+USER_RESPONSE_PATTERN = re.compile(
+    r"Question: [^\n]*?(?P<keyword>how many hours did you spend alone"
+    r"|physical health|mental health|face-to-face conversations|volunteered)"
+    r"[^\n]*?Response: (?P<response>\d+)",
+    re.IGNORECASE
+)
+
+
+def mean_median(data):
+    """
+    Calculate the mean and median of a list of survey responses.
+
+    Args:
+        data (list): Response numbers (at least one)
+
+    Returns:
+        tuple: The mean and the median (the average of the middle two for an even count), as floats
+
+    """
+    # Put the responses in a numpy array, so the mean and median are calculated in C
+    responses = np.fromiter(data, dtype=np.int32, count=len(data))
+    mean = float(responses.mean())
+
+    # Only the middle value(s) need to be in their sorted place for the median, so partition the array
+    # around them instead of sorting all of it
+    mid = len(responses) // 2
+    if len(responses) % 2 != 0:
+        median = float(np.partition(responses, mid)[mid])
+    else:
+        middle = np.partition(responses, (mid - 1, mid))[mid - 1:mid + 1]
+        median = float(middle.mean())
+
+    return mean, median
+
+
 def calculate_user_statistics(file_path, output_file="user_statistics.txt"):
     """
     Calculate mean and median from user data and save the statistics to a file.
@@ -802,52 +981,39 @@ def calculate_user_statistics(file_path, output_file="user_statistics.txt"):
         - A text file containing mean and median statistics for each survey category.
     """
 
-    # Initialize dictionaries to store responses for each category
-    values = {
-        "Hours Alone": [],
-        "Physical Health": [],
-        "Mental Health": [],
-        "Face-to-Face Conversations": [],
-        "Volunteering": []
-    }
-        
-    # Read and parse user data from the input file
+    # Read all user data from the input file at once
     with open(file_path, 'r') as file:
-        for line in file:
-            # Check if the current line corresponds to a specific question category  
-            # Extract the response value and add it to the appropriate category list            
-            if "How many hours did you spend alone" in line:
-                values["Hours Alone"].append(int(line.split("Response: ")[1]))
-            elif "physical health" in line.lower():
-                values["Physical Health"].append(int(line.split("Response: ")[1]))
-            elif "mental health" in line.lower():
-                values["Mental Health"].append(int(line.split("Response: ")[1]))
-            elif "face-to-face conversations" in line.lower():
-                values["Face-to-Face Conversations"].append(int(line.split("Response: ")[1]))
-            elif "volunteered" in line.lower():
-                values["Volunteering"].append(int(line.split("Response: ")[1]))
+        data = file.read()
+
+    # Initialize dictionaries to store responses for each category
+    values = {category: [] for category in USER_STATISTICS_CATEGORIES.values()}
+
+    # Find every answered question in a single search of the whole file,
+    # and add each response to the category of its question keyword
+    for match in USER_RESPONSE_PATTERN.finditer(data):
+        category = USER_STATISTICS_CATEGORIES[match["keyword"].lower()]
+        values[category].append(int(match["response"]))
         
-    # Calculate statistics (mean and median) and write them to the output file
+    # Calculate statistics (mean and median), collecting the text to write in a list first
+    # Start with a header for the output file
+    parts = ["User Statistics:\n\n"]
+    # Iterate through each category in the dictionary
+    for category, data in values.items():
+        if data:
+            # Calculate the mean and median of the collected responses
+            mean, median = mean_median(data)
+            
+            # Add "hours" unit for the "Hours Alone" category                
+            unit = " hours" if category == "Hours Alone" else ""
+            
+            # Add the statistics of this category
+            parts.append(f"{category}:\n")
+            parts.append(f"  Mean: {mean:.2f}{unit}\n")
+            parts.append(f"  Median: {median:.2f}{unit}\n\n")
+
+    # Write all the statistics to the output file at once
     with open(output_file, 'w') as out_file:
-        # Write a header to the output file        
-        out_file.write("User Statistics:\n\n")
-        # Iterate through each category in the dictionary        
-        for category, data in values.items():
-            if data:
-                # Calculate the mean of the collected responses                
-                mean = sum(data) / len(data)
-                # Calculate the median of the collected responses                
-                sorted_data = sorted(data)
-                mid = len(sorted_data) // 2
-                median = sorted_data[mid] if len(sorted_data) % 2 != 0 else (sorted_data[mid-1] + sorted_data[mid]) / 2
-                
-                # Add "hours" unit for the "Hours Alone" category                
-                unit = " hours" if category == "Hours Alone" else ""
-                
-                # Write the statistics to the output file                
-                out_file.write(f"{category}:\n")
-                out_file.write(f"  Mean: {mean:.2f}{unit}\n")
-                out_file.write(f"  Median: {median:.2f}{unit}\n\n")
+        out_file.write("".join(parts))
 
     # Print a confirmation message    
     print(f"User statistics have been saved to {output_file}")
@@ -855,13 +1021,19 @@ def calculate_user_statistics(file_path, output_file="user_statistics.txt"):
 
 
 # Module 7: Parsing and Comparing Statistics
+
+# Pattern finding the statistic type and its value on a line of a statistics file, e.g. "Mean: 1.99 hours"
+# The value is the first word after the colon; any unit after it is ignored
+STATS_VALUE_PATTERN = re.compile(r"(Mean|Median):\s*(\S+)")
+
+
 def compare_statistics(user_stats_file, benchmark_file):
     """
     Compare user statistics with benchmark values and generate detailed analysis
     
     Parameters:
-        user_stats_file (str): Path to the file containing user statistics
-        benchmark_file (str): Path to the file containing benchmark statistics
+        user_stats_file (str or Path): Path to the file containing user statistics
+        benchmark_file (str or Path): Path to the file containing benchmark statistics
 
     Returns:
         list: A list of dictionaries, each containing a comparison result
@@ -872,7 +1044,7 @@ def compare_statistics(user_stats_file, benchmark_file):
         Parse a statistics file and extract mean and median values.
 
         Parameters:
-            filepath (str): Path to the statistics file.
+            filepath (str or Path): Path to the statistics file.
 
         Returns:
             dict: A dictionary with metrics as keys and their mean/median values as subkeys.
@@ -881,39 +1053,40 @@ def compare_statistics(user_stats_file, benchmark_file):
         stats = {}
         current_metric = None # Keeps track of the current metric being parsed
         
-        # Open the file and parse each line        
+        # Read the whole file at once (statistics files are small), then parse each line
         with open(filepath, 'r') as file:
-            for line in file:
-                line = line.strip() # Remove leading/trailing whitespace
+            lines = file.read().splitlines()
+
+        for line in lines:
+            line = line.strip() # Remove leading/trailing whitespace
+            
+            # Skip empty lines and headers
+            if not line or line.startswith(("User Statistics:", "Benchmarks for", "=")):
+                continue
                 
-                # Skip empty lines and headers
-                if not line or line.startswith(("User Statistics:", "Benchmarks for", "=")):
-                    continue
-                    
-                # Check for metric lines (ends with colon)
-                if line.endswith(':'):
-                    current_metric = line[:-1]  # Remove trailing colon
-                    stats[current_metric] = {}
-                    
-                # Parse mean and median values under the current metric
-                elif current_metric and ('Mean:' in line or 'Median:' in line):
-                    # Split on colon and handle potential "hours" suffix
-                    stat_type, value_part = [x.strip() for x in line.split(':')]
-                    stat_type = stat_type.lower()  # Convert to lowercase for consistent comparison
-                    
-                    # Extract numeric value, removing any units
-                    value_str = value_part.split()[0]  # Take first part before any units
+            # Check for metric lines (ends with colon)
+            if line.endswith(':'):
+                current_metric = line[:-1]  # Remove trailing colon
+                stats[current_metric] = {}
+                
+            # Parse mean and median values under the current metric
+            # A single match finds both the statistic type and its value, without any "hours" suffix
+            elif current_metric:
+                value_match = STATS_VALUE_PATTERN.match(line)
+                if value_match:
+                    stat_type, value_str = value_match.groups()
                     try:
-                        value = float(value_str)
-                        stats[current_metric][stat_type] = value
+                        # Convert the statistic type to lowercase for consistent comparison
+                        stats[current_metric][stat_type.lower()] = float(value_str)
                     except ValueError as e:
                         print(f"Warning: Could not parse value in line: {line} - {e}")
 
-        # Debug print for individual file parsing
-        print(f"\nParsing {filepath}:")
-        print("Found metrics:", list(stats.keys()))
-        for metric, values in stats.items():
-            print(f"{metric}: {values}")
+        # Debug print for individual file parsing (only when DEBUG is turned on)
+        if DEBUG:
+            print(f"\nParsing {filepath}:")
+            print("Found metrics:", list(stats.keys()))
+            for metric, values in stats.items():
+                print(f"{metric}: {values}")
             
         return stats
 
@@ -939,51 +1112,69 @@ def compare_statistics(user_stats_file, benchmark_file):
         
         # Compare user statistics against benchmarks        
         for user_metric, bench_metric in metric_mapping.items():
-            if user_metric in user_stats and bench_metric in benchmark_stats:
-                for stat_type in ['mean', 'median']:
-                    if stat_type in user_stats[user_metric] and stat_type in benchmark_stats[bench_metric]:
-                        user_val = user_stats[user_metric][stat_type]
-                        bench_val = benchmark_stats[bench_metric][stat_type]
-                        
-                        # Calculate absolute and percentage differences
-                        abs_diff = user_val - bench_val
-                        pct_diff = (abs_diff / bench_val * 100) if bench_val != 0 else float('inf')
-                        
-                        # Determine trend 
-                        if abs(pct_diff) <= 5:
-                            trend = "Stable"
-                        else:
-                            trend = "Higher" if pct_diff > 0 else "Lower"
-                        
-                        # Assess significance
-                        if abs(pct_diff) <= 10:
-                            significance = "Normal Range"
-                        elif abs(pct_diff) <= 20:
-                            significance = "Moderate"
-                        else:
-                            significance = "Significant"
-                        
-                        # Append comparison result                        
-                        results.append({
-                            'metric': user_metric,
-                            'stat_type': stat_type.capitalize(),
-                            'user_value': user_val,
-                            'benchmark_value': bench_val,
-                            'absolute_difference': abs_diff,
-                            'percentage_difference': pct_diff,
-                            'trend': trend,
-                            'significance': significance
-                        })
+            # Look up each metric's statistics once; skip metrics missing from either file
+            user_metric_stats = user_stats.get(user_metric)
+            bench_metric_stats = benchmark_stats.get(bench_metric)
+            if not (user_metric_stats and bench_metric_stats):
+                continue
+            for stat_type in ['mean', 'median']:
+                user_val = user_metric_stats.get(stat_type)
+                bench_val = bench_metric_stats.get(stat_type)
+                if user_val is None or bench_val is None:
+                    continue
+
+                # Calculate absolute and percentage differences
+                abs_diff = user_val - bench_val
+                pct_diff = (abs_diff / bench_val * 100) if bench_val != 0 else float('inf')
+                
+                # Determine trend 
+                if abs(pct_diff) <= 5:
+                    trend = "Stable"
+                else:
+                    trend = "Higher" if pct_diff > 0 else "Lower"
+                
+                # Assess significance
+                if abs(pct_diff) <= 10:
+                    significance = "Normal Range"
+                elif abs(pct_diff) <= 20:
+                    significance = "Moderate"
+                else:
+                    significance = "Significant"
+                
+                # Append comparison result                        
+                results.append({
+                    'metric': user_metric,
+                    'stat_type': stat_type.capitalize(),
+                    'user_value': user_val,
+                    'benchmark_value': bench_val,
+                    'absolute_difference': abs_diff,
+                    'percentage_difference': pct_diff,
+                    'trend': trend,
+                    'significance': significance
+                })
         
         return results
     
     except Exception as e:
         print(f"Error during comparison: {str(e)}")
-        import traceback
         traceback.print_exc()
         return []
 
 # Module 8: Generating the comparison_report
+
+# Analysis of one statistic (Mean or Median) of a metric in the comparison report,
+# filled in from a comparison result of `compare_statistics`
+COMPARISON_REPORT_TEMPLATE = (
+    "\n{stat_type} Analysis:\n"  # Specify Mean or Median
+    "  Your Value:          {user_value:.2f}\n"  # User's calculated value
+    "  Benchmark:           {benchmark_value:.2f}\n"  # Benchmark value
+    "  Absolute Difference: {absolute_difference:+.2f}\n"  # Absolute difference
+    "  Percentage Change:   {percentage_difference:+.1f}%\n"  # Percent difference
+    "  Trend:               {trend}\n"  # Qualitative trend
+    "  Assessment:          {significance}\n"  # Assessment of the difference
+)
+
+
 def generate_comparison_report(results, output_file="comparison_report.txt"):
     """
     Generate a detailed comparison report from the analysis results.
@@ -1003,29 +1194,28 @@ def generate_comparison_report(results, output_file="comparison_report.txt"):
 
     """
     try:
-        # Open the specified output file in write mode        
-        with open(output_file, 'w') as f:
-            # Write a header for the report            
-            f.write("Senior Well-Being Analysis - Comparison Report\n")
-            f.write("=" * 50 + "\n\n")
-            
-            current_metric = None  # Track the current metric to avoid redundant headers
+        # Collect the report text in a list first, starting with a header for the report
+        parts = [
+            "Senior Well-Being Analysis - Comparison Report\n",
+            "=" * 50 + "\n\n"
+        ]
+        
+        current_metric = None  # Track the current metric to avoid redundant headers
+        
+        # Iterate through the comparison results to generate the report            
+        for result in results:
+            # Print header for new metrics
+            if current_metric != result['metric']:
+                current_metric = result['metric']
+                parts.append(f"\n{current_metric}\n")   # Write the metric name as a header
+                parts.append("-" * len(current_metric) + "\n")  # Underline the metric header
             
-            # Iterate through the comparison results to generate the report            
-            for result in results:
-                # Print header for new metrics
-                if current_metric != result['metric']:
-                    current_metric = result['metric']
-                    f.write(f"\n{current_metric}\n")   # Write the metric name as a header
-                    f.write("-" * len(current_metric) + "\n")  # Underline the metric header
-                
-                f.write(f"\n{result['stat_type']} Analysis:\n")  # Specify Mean or Median
-                f.write(f"  Your Value:          {result['user_value']:.2f}\n")  # User's calculated value 
-                f.write(f"  Benchmark:           {result['benchmark_value']:.2f}\n")  # Benchmark value
-                f.write(f"  Absolute Difference: {result['absolute_difference']:+.2f}\n")  # Absolute difference
-                f.write(f"  Percentage Change:   {result['percentage_difference']:+.1f}%\n")  # Percent difference
-                f.write(f"  Trend:               {result['trend']}\n")  # Qualitative trend
-                f.write(f"  Assessment:          {result['significance']}\n")  # Assessment of the difference
+            # Fill in the analysis of this statistic with a single format call
+            parts.append(COMPARISON_REPORT_TEMPLATE.format_map(result))
+
+        # Write the whole report to the specified output file at once
+        with open(output_file, 'w') as f:
+            f.write("".join(parts))
                 
         # Confirm successful report generation                
         print(f"\nDetailed comparison report has been saved to {output_file}")
@@ -1066,11 +1256,14 @@ def handle_comparison_and_report():
         if not benchmark_file.endswith('.txt'):
             benchmark_file += '.txt'
             
-        # Check if both files exist
-        if not os.path.exists(user_stats_file):
+        # Check if both files exist (and are files, not folders)
+        # The paths are kept as Path objects and passed on to the comparison
+        user_stats_file = Path(user_stats_file)
+        benchmark_file = Path(benchmark_file)
+        if not user_stats_file.is_file():
             print(f"Error: User statistics file '{user_stats_file}' not found.")
             continue
-        if not os.path.exists(benchmark_file):
+        if not benchmark_file.is_file():
             print(f"Error: Benchmark file '{benchmark_file}' not found.")
             continue
         break  # Exit the loop if both files exist
@@ -1137,23 +1330,60 @@ def main_menu():
         print(f"Dataset contains {cleaned_data.shape[0]} rows and {cleaned_data.shape[1]} columns.")
         
         # Ensure columns are numeric
+        # Time spent alone is checked through its range number, as its labelled ranges are not numbers
         columns_to_numeric = [
             "LONELY_dejong_emotional_social_loneliness_scale_TOTAL",
             "CONNECTION_activities_face_to_face_convorsation_p3m",
             "WELLNESS_self_rated_physical_health",
             "WELLNESS_self_rated_mental_health",
-            "CONNECTION_social_time_alone",
+            "CONNECTION_social_time_alone_bin",
             "CONNECTION_activities_volunteered_p3m"
         ]
 
+        existing_columns = [column for column in columns_to_numeric if column in cleaned_data.columns]
         for column in columns_to_numeric:
-            if column in df.columns:
-                df[column] = pd.to_numeric(df[column], errors='coerce')  # Convert to numeric, coerce errors to NaN
-            else:
+            if column not in cleaned_data.columns:
                 print(f"Warning: Column {column} not found in the dataset.")
 
+        # Convert all the columns to numeric in one call, coercing errors to NaN
+        cleaned_data[existing_columns] = cleaned_data[existing_columns].apply(pd.to_numeric, errors='coerce')
+
         # Drop rows with missing values in these columns
-        df_cleaned = df.dropna(subset=columns_to_numeric)
+        cleaned_data = cleaned_data.dropna(subset=existing_columns)
+
+        # Benchmark values of the cleaned dataset, calculated once for viewing in the menu
+        benchmarks = calculate_benchmarks(cleaned_data)
+
+        # Menu actions, each run when its option is selected
+        def view_cleaned_data():
+            print("\nCleaned Data:")
+            print(cleaned_data.to_string(index=False))
+
+        def view_benchmarks():
+            print("Viewing benchmark values...")
+            save_benchmarks_to_file(benchmarks)
+
+        def enter_new_data():
+            # Call Turtle-based data entry function
+            print("\nEntering new data...")
+            turtle_based_data_entry()
+
+        def calculate_statistics():
+            user_data_file = input("Enter path to your user data file: ")
+            calculate_user_statistics(user_data_file)
+
+        def invalid_choice():
+            print("Invalid choice. Please select a valid option.")
+
+        # Options of the menu and their actions, looked up directly from the selected option
+        menu_actions = {
+            '1': view_cleaned_data,
+            '2': lambda: generate_visualizations(cleaned_data),
+            '3': view_benchmarks,
+            '4': enter_new_data,
+            '5': calculate_statistics,
+            '6': handle_comparison_and_report
+        }
 
         #Menu Loop        
         while True:
@@ -1166,30 +1396,12 @@ def main_menu():
             print("6. Compare Statistics with Benchmark Values and Generate Report")  # Combined option
             print("7. Exit")
 
-            choice = input("Select an option (1-6): ")
-
-            if choice == '1':
-                print("\nCleaned Data:")
-                print(cleaned_data.to_string(index=False))
-            elif choice == '2':
-                generate_visualizations(cleaned_data)
-            elif choice == '3':
-                print("Viewing benchmark values...")
-                save_benchmarks_to_file(benchmarks)
-            elif choice == '4':
-                # Call Turtle-based data entry function
-                print("\nEntering new data...")
-                turtle_based_data_entry()  
-            elif choice == '5':
-                user_data_file = input("Enter path to your user data file: ")
-                calculate_user_statistics(user_data_file)
-            elif choice == '6':
-                handle_comparison_and_report()           
-            elif choice == '7':   
+            choice = input("Select an option (1-7): ")
+
+            if choice == '7':   
                 print("Exiting the program. Goodbye!")
                 break
-            else:
-                print("Invalid choice. Please select a valid option.")
+            menu_actions.get(choice, invalid_choice)()
     except FileNotFoundError:
         print("Error: File not found. Please check the file path and try again.")
 